@@ -4,11 +4,17 @@ Quorum API Client - Fetches solicitations from partner's Quorum platform.
 Maps partner's pre-processed solicitation data to our internal AggregatedRFP format.
 """
 
+import functools
 import os
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 
+import serialization
+
 load_dotenv()
 
 DEFAULT_API_URL = os.getenv(
@@ -16,21 +22,52 @@ DEFAULT_API_URL = os.getenv(
     "https://rca4xjkfei6v6dph5sfetpnv3u0nnbak.lambda-url.us-east-1.on.aws/"
 )
 
+# Module-level session so repeated polls of the Lambda URL reuse keep-alive
+# connections instead of paying a TCP+TLS handshake per call. Retries also
+# smooth over Lambda cold-start 5xx responses.
+# Shared fallback for absent sub-dicts; treat as read-only
+_EMPTY: Dict[str, Any] = {}
+
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+))
+
+
+# The partner feed changes on the order of hours; callers in one process
+# (CLI run + dashboard rerun) often poll within minutes of each other
+_FETCH_TTL_SECONDS = 300
+
 
 def fetch_solicitations(api_url: str = None) -> List[Dict[str, Any]]:
     """
     Fetch solicitations from the partner's Quorum API.
 
     Returns a list of raw solicitation dicts. Handles both single-object
-    and list responses from the API.
+    and list responses from the API. Responses are memoized per URL for
+    ~5 minutes so repeated polls within one process skip the network.
     """
     url = api_url or DEFAULT_API_URL
+    return list(_cached_fetch(url, int(time.time() // _FETCH_TTL_SECONDS)))
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_fetch(url: str, ttl_bucket: int) -> tuple:
+    """Perform the GET, keyed by URL and a coarse time bucket.
+
+    The bucket argument exists purely to expire lru_cache entries: once
+    the wall clock crosses a TTL boundary the key changes and the next
+    call refetches. Returns a tuple so cached results stay immutable.
+    """
     print(f"  Fetching solicitations from: {url}")
 
-    response = requests.get(url, timeout=30)
+    # Separate connect/read timeouts: fail fast on connect, allow slow reads
+    response = _SESSION.get(url, timeout=(5, 30))
     response.raise_for_status()
 
-    data = response.json()
+    data = serialization.loads(response.content)
 
     # Handle different response shapes
     if isinstance(data, list):
@@ -41,13 +78,13 @@ def fetch_solicitations(api_url: str = None) -> List[Dict[str, Any]]:
                 solicitations.append(item["solicitation"])
             else:
                 solicitations.append(item)
-        return solicitations
+        return tuple(solicitations)
     elif isinstance(data, dict):
         if "solicitation" in data:
-            return [data["solicitation"]]
-        return [data]
+            return (data["solicitation"],)
+        return (data,)
 
-    return []
+    return ()
 
 
 def map_to_aggregated_rfp(sol: Dict[str, Any]) -> Dict[str, Any]:
@@ -97,16 +134,16 @@ def map_to_aggregated_rfp(sol: Dict[str, Any]) -> Dict[str, Any]:
     certs, clearances = _extract_certs_and_clearances(compliance, sol)
 
     # --- Evaluation criteria (from clauses + compliance) ---
+    # Check "215" first so the common match skips the casefold allocation
     eval_criteria = []
-    for clause in (clauses.get("far_clauses") or []):
-        if "215" in clause or "evaluation" in clause.lower():
+    for clause in (clauses.get("far_clauses") or ()):
+        if "215" in clause or "evaluation" in clause.casefold():
             eval_criteria.append(clause)
 
     # --- Documents analyzed (from attachments) ---
     docs_analyzed = []
     for doc_type, filename in attachments.items():
-        label = doc_type.replace("_", " ").title()
-        docs_analyzed.append(f"{filename} ({label})")
+        docs_analyzed.append(f"{filename} ({_attachment_label(doc_type)})")
 
     # --- Build the aggregated RFP ---
     return {
@@ -140,11 +177,22 @@ def map_to_aggregated_rfp(sol: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=64)
+def _attachment_label(doc_type: str) -> str:
+    """Human-readable label for an attachment key, memoized across calls.
+
+    The partner API uses a small fixed vocabulary of attachment keys, so
+    the replace/title formatting converges to pure cache hits in bulk runs.
+    """
+    return doc_type.replace("_", " ").title()
+
+
 def _extract_set_asides(sol: Dict[str, Any]) -> List[str]:
     """Derive set-aside types from partner data."""
     set_asides = []
     if sol.get("small_business_set_aside"):
-        competition = (sol.get("project") or {}).get("competition_type", "")
+        project = sol.get("project") or _EMPTY
+        competition = project.get("competition_type", "")
         if competition:
             set_asides.append(competition)
         else:
@@ -162,9 +210,11 @@ def _extract_certs_and_clearances(
     clearances = []
 
     for key, value in compliance.items():
-        if not isinstance(value, str):
+        try:
+            val_lower = value.casefold()
+        except AttributeError:
+            # Non-string compliance values (lists, bools) carry no text to scan
             continue
-        val_lower = value.lower()
         if "clearance" in val_lower or "secret" in val_lower:
             clearances.append(value)
         if "certified" in val_lower or "license" in val_lower:
@@ -173,18 +223,19 @@ def _extract_certs_and_clearances(
     return certs, clearances
 
 
+_PRIMARY_DOC_PRIORITY = (
+    "performance_work_statement",
+    "statement_of_work",
+    "main_solicitation",
+)
+
+
 def _pick_primary_document(attachments: Dict[str, str]) -> Optional[str]:
     """Pick the primary document from attachments by priority."""
-    priority = [
-        "performance_work_statement",
-        "statement_of_work",
-        "main_solicitation",
-    ]
-    for key in priority:
-        if key in attachments:
-            return attachments[key]
-
-    # Return first attachment if none match priority
-    if attachments:
-        return next(iter(attachments.values()))
-    return None
+    for key in _PRIMARY_DOC_PRIORITY:
+        filename = attachments.get(key)
+        if filename is not None:
+            return filename
+    # Fall back to the first attachment; the default makes the empty
+    # case free instead of a separate truthiness check
+    return next(iter(attachments.values()), None)
@@ -4,13 +4,21 @@ Quorum Dashboard - RFP Triage Visualization
 A professional Streamlit dashboard for reviewing RFP triage results.
 """
 
-import json
+import html
+import os
+import numpy as np
+import pandas as pd
 import streamlit as st
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 import subprocess
 import sys
 
+import serialization
+
 # Page configuration - must be first Streamlit command
 st.set_page_config(
     page_title="Quorum - RFP Triage",
@@ -23,172 +31,20 @@ st.set_page_config(
 # CUSTOM STYLING
 # ============================================================================
 
-st.markdown("""
-<style>
-    /* Main theme colors */
-    :root {
-        --primary-color: #1e3a5f;
-        --secondary-color: #3d5a80;
-        --accent-color: #ee6c4d;
-        --success-color: #2d6a4f;
-        --warning-color: #e9c46a;
-        --danger-color: #9b2226;
-        --bg-color: #f8f9fa;
-        --card-bg: #ffffff;
-    }
-    
-    /* Header styling */
-    .main-header {
-        background: linear-gradient(135deg, #1e3a5f 0%, #3d5a80 100%);
-        padding: 1.5rem 2rem;
-        border-radius: 12px;
-        margin-bottom: 2rem;
-        color: white;
-    }
-    
-    .main-header h1 {
-        margin: 0;
-        font-size: 2.2rem;
-        font-weight: 700;
-        letter-spacing: -0.5px;
-    }
-    
-    .main-header p {
-        margin: 0.5rem 0 0 0;
-        opacity: 0.9;
-        font-size: 1rem;
-    }
-    
-    /* Score cards */
-    .score-card {
-        background: white;
-        border-radius: 12px;
-        padding: 1.5rem;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-        border-left: 4px solid;
-        margin-bottom: 1rem;
-        transition: transform 0.2s, box-shadow 0.2s;
-    }
-    
-    .score-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 16px rgba(0,0,0,0.12);
-    }
-    
-    .score-go { border-left-color: #2d6a4f; }
-    .score-conditional { border-left-color: #e9c46a; }
-    .score-nogo { border-left-color: #9b2226; }
-    
-    /* Recommendation badges */
-    .badge {
-        display: inline-block;
-        padding: 0.35rem 0.8rem;
-        border-radius: 20px;
-        font-weight: 600;
-        font-size: 0.85rem;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    .badge-go { background: #d8f3dc; color: #2d6a4f; }
-    .badge-conditional { background: #fff3cd; color: #856404; }
-    .badge-nogo { background: #f8d7da; color: #721c24; }
-    
-    /* Metrics */
-    .metric-container {
-        background: white;
-        border-radius: 12px;
-        padding: 1.2rem;
-        text-align: center;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.06);
-    }
-    
-    .metric-value {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: #1e3a5f;
-    }
-    
-    .metric-label {
-        font-size: 0.9rem;
-        color: #6c757d;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    /* Detail sections */
-    .detail-section {
-        background: #f8f9fa;
-        border-radius: 8px;
-        padding: 1rem 1.2rem;
-        margin-bottom: 1rem;
-    }
-    
-    .detail-section h4 {
-        margin: 0 0 0.8rem 0;
-        color: #1e3a5f;
-        font-size: 1rem;
-        font-weight: 600;
-    }
-    
-    /* Knockout items */
-    .knockout-item {
-        background: #fff5f5;
-        border-left: 3px solid #9b2226;
-        padding: 0.8rem 1rem;
-        margin-bottom: 0.5rem;
-        border-radius: 0 8px 8px 0;
-    }
-    
-    /* Match items */
-    .match-item {
-        background: #f0fdf4;
-        border-left: 3px solid #2d6a4f;
-        padding: 0.8rem 1rem;
-        margin-bottom: 0.5rem;
-        border-radius: 0 8px 8px 0;
-    }
-    
-    /* Gap items */
-    .gap-item {
-        background: #fffbeb;
-        border-left: 3px solid #d97706;
-        padding: 0.8rem 1rem;
-        margin-bottom: 0.5rem;
-        border-radius: 0 8px 8px 0;
-    }
-    
-    /* Sidebar styling */
-    .sidebar .sidebar-content {
-        background: #f8f9fa;
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #1e3a5f 0%, #3d5a80 100%);
-        color: white;
-        border: none;
-        padding: 0.6rem 1.5rem;
-        border-radius: 8px;
-        font-weight: 600;
-        transition: all 0.2s;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-1px);
-        box-shadow: 0 4px 12px rgba(30, 58, 95, 0.3);
-    }
-    
-    /* Progress bar colors */
-    .stProgress > div > div > div > div {
-        background: linear-gradient(90deg, #2d6a4f, #40916c);
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def _css() -> str:
+    """Load the dashboard stylesheet once per server process."""
+    return (Path(__file__).with_name("dashboard.css")).read_text()
+
+
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
+
+
+# HTML templates for card list items (dynamic values are html-escaped)
+_KNOCKOUT_ITEM = '<div class="knockout-item"><strong>{}:</strong> {}</div>'
+_MATCH_ITEM = '<div class="match-item"><strong>{}:</strong> {}</div>'
+_GAP_ITEM = '<div class="gap-item"><strong>{}:</strong> {}{}</div>'
+_PLAIN_ITEM = '<div class="{}">{}</div>'
 
 
 # ============================================================================
@@ -208,35 +64,194 @@ def get_base_paths():
 def load_firm_data(firm_path: Path) -> dict:
     """Load firm data from JSON file."""
     if firm_path.exists():
-        with open(firm_path, 'r') as f:
-            return json.load(f)
+        return serialization.loads(firm_path.read_bytes())
     return {}
 
 
-def load_triage_reports(output_dir: Path) -> list:
-    """Load all triage reports from output directory."""
-    reports = []
-    if output_dir.exists():
-        for report_file in output_dir.glob("triage_report_*.json"):
-            try:
-                with open(report_file, 'r') as f:
-                    report = json.load(f)
-                    report["_file_path"] = str(report_file)
-                    reports.append(report)
-            except Exception as e:
-                st.error(f"Error loading {report_file.name}: {e}")
-    return reports
+def _report_files_signature(output_dir: Path) -> tuple:
+    """Cheap change-detection signature for the report directory.
 
+    One scandir pass yields (name, mtime_ns, size) per report file; any
+    write, delete, or rename changes the tuple and invalidates the cache.
+    """
+    if not output_dir.exists():
+        return ()
+    sig = []
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("triage_report_") and entry.name.endswith(".json"):
+                stat = entry.stat()
+                sig.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(sig))
 
-def load_summary(output_dir: Path) -> dict:
-    """Load triage summary if it exists."""
+
+def _load_one_report(path: Path):
+    """Read and parse one report file; returns (report, error)."""
+    try:
+        report = serialization.loads(path.read_bytes())
+        report["_file_path"] = str(path)
+        return report, None
+    except Exception as e:
+        return None, f"Error loading {path.name}: {e}"
+
+
+# session_state key -> {path_str: (mtime_ns, parsed report or None on error)}
+_REPORTS_STATE_KEY = "_reports_by_path"
+
+
+def load_triage_reports(output_dir: Path) -> list:
+    """Load all triage reports, reparsing only files that changed.
+
+    Parsed reports persist in st.session_state keyed by path and mtime,
+    so a rerun only pays for new or modified files instead of a full
+    reload (and skips st.cache_data's serialization of the cached
+    value). Changed files parse on a thread pool: read_bytes releases
+    the GIL, so disk latency overlaps with JSON decoding. Errors are
+    surfaced from the main thread (Streamlit calls are not thread-safe
+    from workers).
+    """
+    cache = st.session_state.setdefault(_REPORTS_STATE_KEY, {})
+    current = {
+        str(output_dir / name): mtime
+        for name, mtime, _size in _report_files_signature(output_dir)
+    }
+
+    stale = [p for p, mtime in current.items() if cache.get(p, (None,))[0] != mtime]
+    if stale:
+        if len(stale) > 1:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(_load_one_report, map(Path, stale)))
+        else:
+            results = [_load_one_report(Path(stale[0]))]
+        for path_str, (report, error) in zip(stale, results):
+            if error:
+                st.error(error)
+            cache[path_str] = (current[path_str], report)
+
+    # Drop files deleted since the last rerun
+    for path_str in list(cache):
+        if path_str not in current:
+            del cache[path_str]
+
+    return [report for _mtime, report in cache.values() if report is not None]
+
+
+def _reports_signature(output_dir: Path) -> tuple:
+    """Change signature for everything load_triage_index can read.
+
+    The report-file signature alone misses runs that rewrite only the
+    summary (e.g. every RFP errored, so no report files changed), which
+    would leave the sort/filter caches pointing at a differently-sized
+    report list. Folding the summary's mtime in invalidates them too.
+    """
     summary_path = output_dir / "triage_summary.json"
-    if summary_path.exists():
-        with open(summary_path, 'r') as f:
-            return json.load(f)
-    return {}
+    try:
+        summary_mtime = summary_path.stat().st_mtime_ns
+    except OSError:
+        summary_mtime = 0
+    return _report_files_signature(output_dir) + ((summary_path.name, summary_mtime),)
+
+
+def _clear_report_caches():
+    """Invalidate everything derived from the report directory."""
+    st.session_state.pop(_REPORTS_STATE_KEY, None)
+    st.session_state.pop("_reports_df", None)
+    st.session_state.pop("_sort_perms", None)
+    _load_full_report.clear()
+
+
+def _reports_df(reports: list, sig: tuple) -> pd.DataFrame:
+    """Build a small sort/filter frame over the loaded reports.
+
+    Filtering and sorting happen on vectorized columns; "idx" points back
+    into the reports list for rendering the full card. The frame lives in
+    session_state rather than st.cache_data: "idx" is only meaningful
+    against this session's list, and in the fallback path the incremental
+    loader's ordering is per-session, so a globally cached frame could
+    join one session's rows against another session's reports.
+    """
+    cached = st.session_state.get("_reports_df")
+    if cached is not None and cached[0] == sig and len(cached[1]) == len(reports):
+        return cached[1]
+    df = pd.DataFrame({
+        "rfp_id": [r.get("rfp_id", "") for r in reports],
+        "match_score": [r.get("match_score", 0) for r in reports],
+        "recommendation": [r.get("recommendation", "ERROR") for r in reports],
+        "idx": range(len(reports)),
+    })
+    st.session_state["_reports_df"] = (sig, df)
+    return df
+
+
+def _sort_permutations(df: pd.DataFrame, sig: tuple) -> dict:
+    """Precompute all three sort orders once per report-set version.
+
+    np.argsort extracts the sort keys in C instead of calling a Python
+    lambda per comparison; the permutations live in session_state keyed
+    by the directory signature so switching the sort dropdown is just an
+    array take.
+    """
+    cached = st.session_state.get("_sort_perms")
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    scores = df["match_score"].to_numpy(dtype=np.int16)
+    desc = np.argsort(-scores, kind="stable")
+    perms = {
+        "Score (High to Low)": desc,
+        "Score (Low to High)": desc[::-1],
+        "Name (A-Z)": np.argsort(df["rfp_id"].to_numpy(dtype=object), kind="stable"),
+    }
+    st.session_state["_sort_perms"] = (sig, perms)
+    return perms
+
 
+def load_summary(output_dir: Path) -> dict:
+    """Load triage summary if it exists.
 
+    The summary only changes after a fetch-and-score run, so a stat()
+    against the mtime stashed in session_state replaces the open+parse
+    on every other rerun.
+    """
+    summary_path = output_dir / "triage_summary.json"
+    if not summary_path.exists():
+        return {}
+    mtime = summary_path.stat().st_mtime_ns
+    if st.session_state.get("_summary_mtime") == mtime:
+        return st.session_state["_summary"]
+    summary = serialization.loads(summary_path.read_bytes())
+    st.session_state["_summary_mtime"] = mtime
+    st.session_state["_summary"] = summary
+    return summary
+
+
+def load_triage_index(output_dir: Path) -> list:
+    """Load the lightweight per-RFP index used for metrics and the list view.
+
+    The summary's results array carries rfp_id/match_score/recommendation/
+    agency/rfp_title plus the report filename, which is all the list view
+    needs; the full report is only parsed when a card is rendered. Older
+    summaries (or hand-copied report dirs) lack the index fields, so fall
+    back to parsing the full reports.
+    """
+    results = load_summary(output_dir).get("results") or []
+    if results and all("report_file" in r for r in results):
+        index = []
+        for r in results:
+            entry = dict(r)
+            report_file = entry.get("report_file")
+            entry["_file_path"] = str(output_dir / report_file) if report_file else None
+            index.append(entry)
+        return index
+    return load_triage_reports(output_dir)
+
+
+@st.cache_data(show_spinner=False)
+def _load_full_report(path_str: str, mtime_ns: int) -> dict:
+    """Parse one full triage report; mtime_ns keys the cache."""
+    return serialization.loads(Path(path_str).read_bytes())
+
+
+@lru_cache(maxsize=16)
 def get_recommendation_badge(recommendation: str) -> str:
     """Get HTML badge for recommendation."""
     badge_class = {
@@ -249,6 +264,7 @@ def get_recommendation_badge(recommendation: str) -> str:
     return f'<span class="badge {badge_class}">{recommendation}</span>'
 
 
+@lru_cache(maxsize=128)
 def get_score_color(score: int) -> str:
     """Get color based on score."""
     if score >= 70:
@@ -276,6 +292,7 @@ def run_triage_analysis():
                 api_url
             )
 
+        _clear_report_caches()
         return True, len(reports)
     except Exception as e:
         return False, str(e)
@@ -339,6 +356,7 @@ def render_sidebar():
             if output_dir.exists():
                 for f in output_dir.glob("*.json"):
                     f.unlink()
+                _clear_report_caches()
                 st.success("Results cleared")
                 st.rerun()
 
@@ -365,11 +383,15 @@ def render_header():
 
 def render_metrics(reports: list):
     """Render summary metrics."""
+    # Counter tallies the recommendations in one C-level pass
     total = len(reports)
-    go_count = sum(1 for r in reports if r.get("recommendation") == "GO")
-    conditional_count = sum(1 for r in reports if r.get("recommendation") == "CONDITIONAL")
-    nogo_count = sum(1 for r in reports if r.get("recommendation") in ["NO-GO", "ERROR"])
-    avg_score = sum(r.get("match_score", 0) for r in reports) / total if total > 0 else 0
+    counts = Counter(r.get("recommendation", "ERROR") for r in reports)
+    go_count = counts.get("GO", 0)
+    conditional_count = counts.get("CONDITIONAL", 0)
+    nogo_count = counts.get("NO-GO", 0) + counts.get("ERROR", 0)
+    avg_score = (
+        sum(r.get("match_score", 0) or 0 for r in reports) / total if total > 0 else 0
+    )
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -406,20 +428,20 @@ def render_metrics(reports: list):
         """, unsafe_allow_html=True)
 
 
+@st.fragment
 def render_rfp_card(report: dict, expanded: bool = False):
-    """Render a single RFP result card."""
+    """Render a single RFP result card.
+
+    Accepts either a lightweight index entry or a full report. The full
+    payload is loaded (and cached) per card, so the list view never has
+    to parse every report's knockouts/matches/gaps up front.
+    """
     rfp_id = report.get("rfp_id", "Unknown")
     score = report.get("match_score", 0)
     recommendation = report.get("recommendation", "ERROR")
     agency = report.get("agency", "Agency not identified")
     title = report.get("rfp_title", "Title not available")
-    knockouts = report.get("knockouts", [])
-    matches = report.get("strong_matches", [])
-    gaps = report.get("gaps", [])
-    technical_summary = report.get("technical_summary", "")
-    personnel = report.get("recommended_personnel", [])
-    documents = report.get("documents_analyzed", [])
-    
+
     # Card styling based on recommendation
     card_class = {
         "GO": "score-go",
@@ -427,8 +449,23 @@ def render_rfp_card(report: dict, expanded: bool = False):
         "NO-GO": "score-nogo",
         "ERROR": "score-nogo"
     }.get(recommendation, "score-nogo")
-    
+
     with st.expander(f"**{rfp_id}** — Score: {score}/100 | {recommendation}", expanded=expanded):
+        # Index entries carry only list-view fields; pull the rest on demand
+        if "technical_summary" not in report:
+            path = report.get("_file_path")
+            if path and os.path.exists(path):
+                report = _load_full_report(path, os.stat(path).st_mtime_ns)
+
+        knockouts = report.get("knockouts", [])
+        if not isinstance(knockouts, list):  # index entries hold a count
+            knockouts = []
+        matches = report.get("strong_matches", [])
+        gaps = report.get("gaps", [])
+        technical_summary = report.get("technical_summary", "")
+        personnel = report.get("recommended_personnel", [])
+        documents = report.get("documents_analyzed", [])
+
         # Header row
         col1, col2, col3 = st.columns([2, 1, 1])
         
@@ -472,55 +509,53 @@ def render_rfp_card(report: dict, expanded: bool = False):
             st.markdown("#### 📝 Technical Assessment")
             st.info(technical_summary)
         
-        # Knockouts (if any)
+        # Knockouts (if any) - one joined markdown call per section keeps
+        # the Streamlit delta count at 1 instead of 1 per item
         if knockouts:
             st.markdown("#### ⛔ Knockout Disqualifiers")
+            parts = []
             for ko in knockouts:
                 if isinstance(ko, dict):
-                    st.markdown(f"""
-                    <div class="knockout-item">
-                        <strong>{ko.get('type', 'Issue')}:</strong> {ko.get('reason', ko.get('detail', str(ko)))}
-                    </div>
-                    """, unsafe_allow_html=True)
+                    parts.append(_KNOCKOUT_ITEM.format(
+                        html.escape(str(ko.get('type', 'Issue'))),
+                        html.escape(str(ko.get('reason', ko.get('detail', ko))))
+                    ))
                 else:
-                    st.markdown(f"""
-                    <div class="knockout-item">{ko}</div>
-                    """, unsafe_allow_html=True)
-        
+                    parts.append(_PLAIN_ITEM.format("knockout-item", html.escape(str(ko))))
+            st.markdown("".join(parts), unsafe_allow_html=True)
+
         # Two columns for matches and gaps
         col_match, col_gap = st.columns(2)
-        
+
         with col_match:
             if matches:
                 st.markdown("#### ✅ Strong Matches")
+                parts = []
                 for match in matches[:5]:
                     if isinstance(match, dict):
-                        st.markdown(f"""
-                        <div class="match-item">
-                            <strong>{match.get('type', 'Match')}:</strong> {match.get('detail', str(match))}
-                        </div>
-                        """, unsafe_allow_html=True)
+                        parts.append(_MATCH_ITEM.format(
+                            html.escape(str(match.get('type', 'Match'))),
+                            html.escape(str(match.get('detail', match)))
+                        ))
                     else:
-                        st.markdown(f"""
-                        <div class="match-item">{match}</div>
-                        """, unsafe_allow_html=True)
-        
+                        parts.append(_PLAIN_ITEM.format("match-item", html.escape(str(match))))
+                st.markdown("".join(parts), unsafe_allow_html=True)
+
         with col_gap:
             if gaps:
                 st.markdown("#### ⚠️ Capability Gaps")
+                parts = []
                 for gap in gaps[:5]:
                     if isinstance(gap, dict):
                         mitigation = gap.get('mitigation', '')
-                        st.markdown(f"""
-                        <div class="gap-item">
-                            <strong>{gap.get('type', 'Gap')}:</strong> {gap.get('detail', str(gap))}
-                            {f'<br><em>Mitigation: {mitigation}</em>' if mitigation else ''}
-                        </div>
-                        """, unsafe_allow_html=True)
+                        parts.append(_GAP_ITEM.format(
+                            html.escape(str(gap.get('type', 'Gap'))),
+                            html.escape(str(gap.get('detail', gap))),
+                            f'<br><em>Mitigation: {html.escape(str(mitigation))}</em>' if mitigation else ''
+                        ))
                     else:
-                        st.markdown(f"""
-                        <div class="gap-item">{gap}</div>
-                        """, unsafe_allow_html=True)
+                        parts.append(_PLAIN_ITEM.format("gap-item", html.escape(str(gap))))
+                st.markdown("".join(parts), unsafe_allow_html=True)
         
         # Recommended Personnel
         if personnel:
@@ -554,54 +589,60 @@ def render_empty_state():
         st.warning("QUORUM_API_URL not set in .env file. Please configure it to connect to the partner API.")
 
 
-def render_results_list(reports: list):
-    """Render the list of RFP results."""
+@st.fragment
+def render_results_list(output_dir: Path):
+    """Render the list of RFP results.
+
+    Runs as a fragment so changing the sort/filter widgets reruns only
+    this block instead of the whole page (sidebar, metrics, firm data).
+    The reports themselves come from the cached loader, so re-entry is
+    a cache hit.
+    """
+    reports = load_triage_index(output_dir)
     # Sort options
     col1, col2 = st.columns([3, 1])
-    
+
     with col1:
         st.markdown("### 📊 Analysis Results")
-    
+
     with col2:
         sort_option = st.selectbox(
             "Sort by",
             ["Score (High to Low)", "Score (Low to High)", "Name (A-Z)"],
             label_visibility="collapsed"
         )
-    
-    # Sort reports
-    if sort_option == "Score (High to Low)":
-        reports = sorted(reports, key=lambda x: x.get("match_score", 0), reverse=True)
-    elif sort_option == "Score (Low to High)":
-        reports = sorted(reports, key=lambda x: x.get("match_score", 0))
-    else:
-        reports = sorted(reports, key=lambda x: x.get("rfp_id", ""))
-    
+
     # Filter options
     filter_col1, filter_col2 = st.columns(2)
-    
+
     with filter_col1:
         rec_filter = st.multiselect(
             "Filter by Recommendation",
             ["GO", "CONDITIONAL", "NO-GO"],
             default=["GO", "CONDITIONAL", "NO-GO"]
         )
-    
+
     with filter_col2:
         min_score = st.slider("Minimum Score", 0, 100, 0)
-    
-    # Apply filters
-    filtered_reports = [
-        r for r in reports 
-        if r.get("recommendation", "ERROR") in rec_filter + (["ERROR"] if "NO-GO" in rec_filter else [])
-        and r.get("match_score", 0) >= min_score
-    ]
-    
-    st.markdown(f"*Showing {len(filtered_reports)} of {len(reports)} results*")
-    
-    # Render cards
-    for report in filtered_reports:
-        render_rfp_card(report)
+
+    # Vectorized sort + filter on the cached frame, built from the same
+    # reports list the cards index into so "idx" always aligns
+    sig = _reports_signature(output_dir)
+    df = _reports_df(reports, sig)
+
+    perms = _sort_permutations(df, sig)
+    df = df.take(perms[sort_option])
+
+    # ERROR rows surface alongside NO-GO; frozenset gives O(1) membership
+    allowed = frozenset(rec_filter) | ({"ERROR"} if "NO-GO" in rec_filter else frozenset())
+    mask = df["recommendation"].isin(allowed) & (df["match_score"] >= min_score)
+    filtered_df = df[mask]
+
+    st.markdown(f"*Showing {len(filtered_df)} of {len(reports)} results*")
+
+    # Render cards (itertuples avoids per-row Series construction)
+    for row in filtered_df.itertuples(index=False):
+        render_rfp_card(reports[row.idx])
 
 
 # ============================================================================
@@ -618,8 +659,8 @@ def main():
     # Render main content
     render_header()
     
-    # Load reports
-    reports = load_triage_reports(paths["output"])
+    # Load the lightweight index (metrics and list view don't need full reports)
+    reports = load_triage_index(paths["output"])
     
     if reports:
         # Show metrics
@@ -627,7 +668,7 @@ def main():
         st.markdown("<br>", unsafe_allow_html=True)
         
         # Show results
-        render_results_list(reports)
+        render_results_list(paths["output"])
     else:
         render_empty_state()
     
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Shared JSON helpers - single place that picks the fastest available
+serializer (orjson, ~2-10x stdlib) and falls back to stdlib json when it
+is not installed. All JSON producers/consumers in the project should go
+through dumps()/loads() so the fallback logic lives in one spot.
+"""
+
+import json
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+if _orjson is not None:
+    # OPT_NON_STR_KEYS keeps parity with stdlib (which stringifies int
+    # keys); OPT_NAIVE_UTC normalizes naive datetimes if any slip through.
+    _DUMP_OPTS = _orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS | _orjson.OPT_NAIVE_UTC
+
+    def dumps(obj) -> bytes:
+        """Serialize to indented JSON bytes."""
+        return _orjson.dumps(obj, option=_DUMP_OPTS)
+
+    def loads(data):
+        """Parse JSON from bytes or str."""
+        return _orjson.loads(data)
+else:
+    def dumps(obj) -> bytes:
+        """Serialize to indented JSON bytes (stdlib fallback)."""
+        return json.dumps(obj, indent=2, default=str).encode()
+
+    def loads(data):
+        """Parse JSON from bytes or str (stdlib fallback)."""
+        return json.loads(data)
@@ -4,69 +4,78 @@ Quorum Phase 2: Intelligent Triage - Secondary Filter
 Fetches pre-processed solicitations from partner API and scores against firm capabilities.
 """
 
+import asyncio
+import functools
+import hashlib
 import json
+import operator
 import os
+import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Any, TypedDict, Optional
+from typing import Annotated, List, Dict, Any, TypedDict, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 
-from pydantic import BaseModel, Field
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, SystemMessage
-from langgraph.graph import StateGraph, END
+import msgspec
 
+import serialization
 from api_client import fetch_solicitations, map_to_aggregated_rfp
 
+# langchain_anthropic and langgraph are imported lazily inside the
+# functions that need them: they cost most of a second at import time,
+# which the dashboard otherwise pays just to render cached results.
+
 # Load environment variables
 load_dotenv()
 
 
 # ============================================================================
-# PYDANTIC SCHEMAS
+# DATA SCHEMAS
 # ============================================================================
+# msgspec structs: C-implemented construction and JSON encoding, roughly an
+# order of magnitude cheaper per record than pydantic model validation.
 
-class AggregatedRFP(BaseModel):
+class AggregatedRFP(msgspec.Struct, kw_only=True):
     """Aggregated information for a single solicitation."""
-    rfp_id: str = Field(..., description="Solicitation number or ID")
-    agency: Optional[str] = Field(None)
-    title: Optional[str] = Field(None)
-    naics_codes: List[str] = Field(default_factory=list)
-    set_asides: List[str] = Field(default_factory=list)
-    contract_value: Optional[str] = Field(None)
-    period_of_performance: Optional[str] = Field(None)
-    deadline: Optional[str] = Field(None)
-    all_requirements: List[Dict[str, str]] = Field(default_factory=list)
-    certifications_required: List[str] = Field(default_factory=list)
-    clearances_required: List[str] = Field(default_factory=list)
-    key_tasks: List[str] = Field(default_factory=list)
-    evaluation_criteria: List[str] = Field(default_factory=list)
-    documents_analyzed: List[str] = Field(default_factory=list)
-    primary_document: Optional[str] = Field(None)
-
-
-class TriageReport(BaseModel):
+    rfp_id: str  # Solicitation number or ID
+    agency: Optional[str] = None
+    title: Optional[str] = None
+    naics_codes: List[str] = msgspec.field(default_factory=list)
+    set_asides: List[str] = msgspec.field(default_factory=list)
+    contract_value: Optional[str] = None
+    period_of_performance: Optional[str] = None
+    deadline: Optional[str] = None
+    all_requirements: List[Dict[str, str]] = msgspec.field(default_factory=list)
+    certifications_required: List[str] = msgspec.field(default_factory=list)
+    clearances_required: List[str] = msgspec.field(default_factory=list)
+    key_tasks: List[str] = msgspec.field(default_factory=list)
+    evaluation_criteria: List[str] = msgspec.field(default_factory=list)
+    documents_analyzed: List[str] = msgspec.field(default_factory=list)
+    primary_document: Optional[str] = None
+
+
+class TriageReport(msgspec.Struct, kw_only=True):
     """The final triage report output."""
-    rfp_id: str = Field(..., description="Solicitation identifier")
-    rfp_title: Optional[str] = Field(None)
-    agency: Optional[str] = Field(None)
-    match_score: int = Field(..., ge=0, le=100, description="Overall fit score (0-100)")
-    recommendation: str = Field(..., description="GO, NO-GO, or CONDITIONAL")
-    knockouts: List[Dict[str, str]] = Field(default_factory=list)
-    strong_matches: List[Dict[str, str]] = Field(default_factory=list)
-    gaps: List[Dict[str, str]] = Field(default_factory=list)
-    naics_match: bool = Field(False)
-    set_aside_eligible: bool = Field(True)
-    technical_summary: str = Field(...)
-    recommended_personnel: List[str] = Field(default_factory=list)
-    documents_analyzed: List[str] = Field(default_factory=list)
-    analysis_timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+    rfp_id: str  # Solicitation identifier
+    match_score: int  # Overall fit score (0-100)
+    recommendation: str  # GO, NO-GO, or CONDITIONAL
+    technical_summary: str
+    rfp_title: Optional[str] = None
+    agency: Optional[str] = None
+    knockouts: List[Dict[str, str]] = msgspec.field(default_factory=list)
+    strong_matches: List[Dict[str, str]] = msgspec.field(default_factory=list)
+    gaps: List[Dict[str, str]] = msgspec.field(default_factory=list)
+    naics_match: bool = False
+    set_aside_eligible: bool = True
+    recommended_personnel: List[str] = msgspec.field(default_factory=list)
+    documents_analyzed: List[str] = msgspec.field(default_factory=list)
+    analysis_timestamp: str = msgspec.field(default_factory=lambda: datetime.now().isoformat())
     # New fields from partner API
-    solicitation_number: Optional[str] = Field(None)
-    deadline: Optional[str] = Field(None)
-    original_url: Optional[str] = Field(None)
-    posted_date: Optional[str] = Field(None)
+    solicitation_number: Optional[str] = None
+    deadline: Optional[str] = None
+    original_url: Optional[str] = None
+    posted_date: Optional[str] = None
 
 
 # ============================================================================
@@ -88,26 +97,29 @@ class TriageState(TypedDict):
     # Firm Data
     firm_capabilities: Dict[str, Any]
 
-    # Analysis
-    knockouts: List[Dict[str, str]]
-    matches: List[Dict[str, str]]
-    gaps: List[Dict[str, str]]
-
-    # Final Output
-    final_report: Dict[str, Any]
+    # Final Output. operator.add is the reducer: each parallel scorer
+    # branch contributes a one-element list and LangGraph concatenates
+    # them, which is what lets the Send fan-out run branches in parallel
+    # without conflicting writes.
+    final_reports: Annotated[List[Dict[str, Any]], operator.add]
 
 
 # ============================================================================
 # NODE 1: FETCHER (replaces Scanner + Extractor + Aggregator)
 # ============================================================================
 
-def node_fetcher(state: TriageState) -> TriageState:
+def node_fetcher(state: TriageState) -> Dict[str, Any]:
     """
     Node 1: Fetch solicitations from partner API and map to internal format.
     Replaces the old Scanner -> Extractor -> Aggregator pipeline.
     """
     print("[1/2] FETCHER - Retrieving solicitations from partner API...")
 
+    if state.get("solicitations"):
+        # Caller already supplied mapped solicitations; nothing to fetch
+        print(f"  Using {len(state['solicitations'])} pre-loaded solicitation(s)")
+        return {}
+
     raw_solicitations = fetch_solicitations(state.get("api_url"))
     print(f"  Retrieved {len(raw_solicitations)} solicitation(s)")
 
@@ -117,35 +129,294 @@ def node_fetcher(state: TriageState) -> TriageState:
         mapped.append(aggregated)
         print(f"  Mapped: {aggregated.get('rfp_id')} - {aggregated.get('title', 'No title')}")
 
-    state["solicitations"] = mapped
-    return state
+    return {"solicitations": mapped}
 
 
 # ============================================================================
 # NODE 2: SCORER
 # ============================================================================
 
-def node_scorer(state: TriageState) -> TriageState:
+# Set-aside program tokens recognized in both RFP set-aside strings and
+# firm business-type descriptions. One C-level regex scan replaces the
+# old nested substring loops.
+_SET_ASIDE_RE = re.compile(
+    r"SDVOSB|HUBZONE|WOSB|SDB|8\(A\)|MINORITY|SMALL BUSINESS",
+    re.IGNORECASE,
+)
+
+# Programs that hard-disqualify a non-holder (vs. merely not matching)
+_RESTRICTED_SET_ASIDES = frozenset({"SDVOSB", "HUBZONE", "8(A)"})
+
+# Grabs the outermost JSON object out of LLM prose in the parse fallback
+_JSON_BLOCK_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def _set_aside_tokens(text: str) -> frozenset:
+    """Extract normalized set-aside program tokens from free text."""
+    return frozenset(m.upper() for m in _SET_ASIDE_RE.findall(text))
+
+
+def _clearance_rank(text: str) -> int:
+    """Map free-text clearance language to a comparable rank.
+
+    Compliance values are full sentences ("Top Secret clearance
+    required"), so ranking is a containment check on the normalized
+    text: 2 = top secret, 1 = secret, 0 = none/unspecified. One integer
+    comparison then replaces the repeated substring scans per RFP.
     """
-    Node 2: Score the aggregated RFP against firm capabilities.
-    Generate final triage report with recommendation.
+    lowered = text.casefold()
+    if "top secret" in lowered or "ts/sci" in lowered:
+        return 2
+    if "secret" in lowered:
+        return 1
+    return 0
+
+
+# Compact separators for prompt JSON: the model does not need pretty
+# printing, and the whitespace is pure input-token cost
+_COMPACT = (",", ":")
+
+
+def _dedupe_requirements(
+    requirements: List[Dict[str, str]], cap: int = 20, max_chars: int = 300
+) -> List[Dict[str, str]]:
+    """Dedupe and cap requirement entries before they enter the prompt.
+
+    Partner scope data often repeats boilerplate responsibilities across
+    sections; entries are deduped on a hash of their leading text, long
+    entries are truncated, and the list is capped so prompt size stays
+    bounded regardless of how verbose the solicitation is.
     """
-    print("\n[2/2] SCORER - Evaluating firm fit...")
+    seen = set()
+    deduped = []
+    for req in requirements:
+        text = req.get("text", "")
+        key = hash(text[:120])
+        if key in seen:
+            continue
+        seen.add(key)
+        if len(text) > max_chars:
+            req = {**req, "text": text[:max_chars]}
+        deduped.append(req)
+        if len(deduped) >= cap:
+            break
+    return deduped
+
+
+# Semantic pre-pass thresholds (cosine similarity). Pairs above the
+# match threshold are reported as evidence; an RFP whose best pair sits
+# below the skip floor has so little overlap with the firm's work that
+# the LLM round trip is not worth paying for.
+_EMBED_MATCH_THRESHOLD = 0.45
+_EMBED_SKIP_FLOOR = 0.25
+
+
+@functools.lru_cache(maxsize=1)
+def _embedding_model():
+    """Load the MiniLM sentence encoder once, or None when unavailable.
+
+    sentence-transformers is an optional dependency (it pulls in torch);
+    without it the semantic pre-pass simply disables itself and every
+    RFP goes to the LLM as before.
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
+    return SentenceTransformer("all-MiniLM-L6-v2")
+
+
+@functools.lru_cache(maxsize=4)
+def _firm_embeddings(firm_data_hash: str, cap_texts: tuple):
+    """Encode the firm's capability texts once per firm-data content."""
+    model = _embedding_model()
+    if model is None or not cap_texts:
+        return None
+    return model.encode(list(cap_texts), normalize_embeddings=True)
+
+
+def _semantic_prepass(
+    aggregated: Dict[str, Any],
+    firm_data: Dict[str, Any],
+    matches: List[Dict[str, str]],
+    gaps: List[Dict[str, str]],
+) -> Optional[float]:
+    """Score RFP tasks against firm capabilities with local embeddings.
+
+    One normalized matmul replaces a chunk of what the LLM was asked to
+    do: high-similarity pairs are appended to matches and clear misses
+    to gaps, as evidence the LLM prompt then carries for free. Returns
+    the best cosine similarity, or None when embeddings are disabled.
+    """
+    model = _embedding_model()
+    if model is None:
+        return None
+
+    capabilities = firm_data.get("capabilities", {})
+    cap_texts = tuple(
+        (capabilities.get("core_competencies") or [])
+        + (capabilities.get("specialized_expertise") or [])
+    )
+    firm_emb = _firm_embeddings(firm_data.get("_firm_data_hash", ""), cap_texts)
+    if firm_emb is None:
+        return None
+
+    rfp_texts = [t for t in aggregated.get("key_tasks", [])[:15] if t]
+    rfp_texts += [
+        req["text"] for req in _dedupe_requirements(aggregated.get("all_requirements", []))
+        if req.get("text")
+    ]
+    if not rfp_texts:
+        return None
+
+    # Both sides are L2-normalized, so the matmul yields cosine directly
+    rfp_emb = model.encode(rfp_texts, normalize_embeddings=True)
+    sims = rfp_emb @ firm_emb.T  # (tasks, capabilities)
+    best = sims.max(axis=1)
+
+    for i in best.argsort()[::-1][:3]:
+        if best[i] < _EMBED_MATCH_THRESHOLD:
+            break
+        matches.append({
+            "type": "Semantic Match",
+            "detail": (
+                f"'{rfp_texts[i][:80]}' aligns with capability "
+                f"'{cap_texts[sims[i].argmax()][:80]}' (cosine {best[i]:.2f})"
+            ),
+        })
+    for i in best.argsort()[:3]:
+        if best[i] >= _EMBED_SKIP_FLOOR:
+            break
+        gaps.append({
+            "type": "Semantic Gap",
+            "detail": f"No firm capability resembles '{rfp_texts[i][:80]}'",
+            "mitigation": "Consider teaming for this task area",
+        })
+
+    return float(best.max())
+
+
+def _low_similarity_analysis(max_similarity: float) -> Dict[str, Any]:
+    """Templated analysis for RFPs the embedding pre-pass rules out."""
+    return {
+        "additional_matches": [],
+        "gaps": [],
+        "technical_summary": (
+            "Semantic pre-pass found no meaningful overlap between RFP "
+            f"tasks and firm capabilities (best cosine {max_similarity:.2f}); "
+            "skipped detailed LLM review."
+        ),
+        "recommended_personnel": [],
+        "score_adjustment": -10,
+    }
+
+
+def _below_similarity_floor(context: Dict[str, Any]) -> bool:
+    """True when the pre-pass ran and found too little overlap for an LLM call."""
+    max_similarity = context.get("max_similarity")
+    return max_similarity is not None and max_similarity < _EMBED_SKIP_FLOOR
+
 
-    # Load firm data
-    with open(state["firm_data_path"], 'r') as f:
-        firm_data = json.load(f)
+# Analysis shape used when the LLM response cannot be parsed
+_FALLBACK_ANALYSIS = {
+    "additional_matches": [],
+    "gaps": [],
+    "technical_summary": "Analysis failed",
+    "recommended_personnel": [],
+    "score_adjustment": 0,
+}
 
-    state["firm_capabilities"] = firm_data
-    aggregated = state["aggregated_rfp"]
 
+def _make_llm():
+    """Construct the Claude Haiku client used for fit analysis.
+
+    With QUORUM_LATENCY_OPTIMIZED=1 (and langchain-aws installed), route
+    through Bedrock's Converse API with latency-optimized inference,
+    which roughly doubles Claude throughput. Deployments without Bedrock
+    access fall back to the direct Anthropic client.
+    """
+    if os.getenv("QUORUM_LATENCY_OPTIMIZED") == "1":
+        try:
+            from langchain_aws import ChatBedrockConverse
+
+            return ChatBedrockConverse(
+                model_id=os.getenv(
+                    "QUORUM_BEDROCK_MODEL_ID",
+                    "anthropic.claude-3-haiku-20240307-v1:0"
+                ),
+                performance_config={"latency": "optimized"},
+                temperature=0,
+                max_tokens=4096,
+            )
+        except ImportError:
+            print("  langchain-aws not installed; using direct Anthropic client")
+
+    from langchain_anthropic import ChatAnthropic
+
+    return ChatAnthropic(
+        model="claude-3-haiku-20240307",
+        temperature=0,
+        max_tokens=4096
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_firm_data(path: str, mtime: float) -> Dict[str, Any]:
+    """Load and parse firm data once per (path, mtime).
+
+    A bulk run scores every RFP against the same capability document;
+    caching on mtime means edits to the file still take effect while
+    repeat loads cost a dict lookup. Derived lookup structures that are
+    invariant across RFPs are precomputed here and stashed on the dict
+    under underscore keys.
+    """
+    raw = Path(path).read_bytes()
+    firm_data = serialization.loads(raw)
+
+    metadata = firm_data.get("firm_metadata", {})
+    # Content hash feeds the LLM cache key so capability edits invalidate
+    # cached analyses without any manual cache busting
+    firm_data["_firm_data_hash"] = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    firm_data["_firm_naics_fset"] = frozenset(
+        str(code).strip() for code in metadata.get("naics_codes", [])
+    )
+    firm_data["_firm_bt_upper"] = str(metadata.get("business_type", [])).upper()
+    firm_data["_firm_sa_tokens"] = _set_aside_tokens(
+        " | ".join(metadata.get("business_type", []))
+    )
+    firm_data["_firm_clearance_rank"] = _clearance_rank(
+        metadata.get("clearance_level") or "None"
+    )
+    return firm_data
+
+
+def load_firm_data(firm_data_path) -> Dict[str, Any]:
+    """Cached firm-data load keyed by path and current mtime."""
+    path = str(firm_data_path)
+    return _load_firm_data(path, os.path.getmtime(path))
+
+
+def prepare_scorer(aggregated: Dict[str, Any], firm_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run the programmatic checks and build the LLM analysis prompt for one RFP.
+
+    Returns a context dict consumed by finalize_scorer once the LLM
+    analysis is available; splitting the two lets callers batch the LLM
+    round trips across solicitations.
+    """
     # === PROGRAMMATIC CHECKS ===
     knockouts = []
     matches = []
     gaps = []
 
-    # 1. NAICS Code Check
-    firm_naics = set(firm_data.get("firm_metadata", {}).get("naics_codes", []))
+    # 1. NAICS Code Check: the firm's codes are invariant across RFPs,
+    # so reuse the frozenset precomputed by the cached loader
+    firm_naics = firm_data.get("_firm_naics_fset")
+    if firm_naics is None:
+        firm_naics = frozenset(
+            str(code).strip()
+            for code in firm_data.get("firm_metadata", {}).get("naics_codes", [])
+        )
     rfp_naics = set(aggregated.get("naics_codes", []))
     naics_match = bool(firm_naics & rfp_naics) if rfp_naics else True
 
@@ -162,62 +433,61 @@ def node_scorer(state: TriageState) -> TriageState:
             "detail": f"Firm NAICS codes match: {', '.join(matching_naics)}"
         })
 
-    # 2. Set-Aside Check
-    firm_business_types = firm_data.get("firm_metadata", {}).get("business_type", [])
+    # 2. Set-Aside Check: one regex scan per set-aside string, then O(1)
+    # token-set intersections against the firm's precomputed tokens
+    firm_sa_tokens = firm_data.get("_firm_sa_tokens")
+    if firm_sa_tokens is None:
+        firm_sa_tokens = _set_aside_tokens(
+            " | ".join(firm_data.get("firm_metadata", {}).get("business_type", []))
+        )
     rfp_set_asides = aggregated.get("set_asides", [])
     set_aside_eligible = True
 
-    set_aside_mapping = {
-        "WOSB": ["Woman Owned Small Business (WOSB)", "WOSB"],
-        "SDB": ["Small Disadvantaged Business (SDB)", "SDB"],
-        "8(a)": ["8(a)"],
-        "Minority": ["Minority Owned Business", "Minority Owned"],
-        "Small Business": ["Small Business", "Small Business Set-Aside", "Competitive Small Business Set Aside"]
-    }
-
     for sa in rfp_set_asides:
-        if sa in ["Full and Open", "Unrestricted"]:
+        if sa in ("Full and Open", "Unrestricted", ""):
             continue
-        matched = False
-        for key, values in set_aside_mapping.items():
-            if sa in values or any(v in sa for v in values):
-                if any(bt in firm_business_types or any(v in bt for v in values) for bt in firm_business_types):
-                    matched = True
-                    matches.append({
-                        "type": "Set-Aside Eligible",
-                        "detail": f"Firm qualifies for {sa} set-aside"
-                    })
-                    break
-        if not matched and sa not in ["Full and Open", "Unrestricted", ""]:
-            if any(x in sa.upper() for x in ["SDVOSB", "HUBZONE", "8(A)"]) and not any(x in str(firm_business_types).upper() for x in ["SDVOSB", "HUBZONE", "8(A)"]):
-                knockouts.append({
-                    "type": "Set-Aside Ineligible",
-                    "reason": f"RFP requires {sa} set-aside. Firm does not qualify.",
-                    "severity": "HIGH"
-                })
-                set_aside_eligible = False
-
-    # 3. Clearance Check
+        sa_tokens = _set_aside_tokens(sa)
+        if sa_tokens & firm_sa_tokens:
+            matches.append({
+                "type": "Set-Aside Eligible",
+                "detail": f"Firm qualifies for {sa} set-aside"
+            })
+        elif sa_tokens & _RESTRICTED_SET_ASIDES:
+            knockouts.append({
+                "type": "Set-Aside Ineligible",
+                "reason": f"RFP requires {sa} set-aside. Firm does not qualify.",
+                "severity": "HIGH"
+            })
+            set_aside_eligible = False
+
+    # 3. Clearance Check: rank both sides once, then compare integers.
+    # The firm's rank comes precomputed from the cached loader.
     rfp_clearances = aggregated.get("clearances_required", [])
     firm_clearance = firm_data.get("firm_metadata", {}).get("clearance_level", "None")
+    firm_rank = firm_data.get("_firm_clearance_rank")
+    if firm_rank is None:
+        firm_rank = _clearance_rank(firm_clearance or "None")
+
+    if rfp_clearances:
+        required_rank, required_text = max(
+            ((_clearance_rank(c), c) for c in rfp_clearances if c),
+            default=(0, ""),
+        )
+        if required_rank > firm_rank:
+            knockouts.append({
+                "type": "Clearance Gap",
+                "reason": f"RFP requires {required_text}. Firm clearance: {firm_clearance}",
+                "severity": "HIGH"
+            })
 
-    for clearance in rfp_clearances:
-        if clearance and "secret" in clearance.lower():
-            if "secret" not in firm_clearance.lower() and "top secret" not in firm_clearance.lower():
-                knockouts.append({
-                    "type": "Clearance Gap",
-                    "reason": f"RFP requires {clearance}. Firm clearance: {firm_clearance}",
-                    "severity": "HIGH"
-                })
-
-    # === LLM-BASED ANALYSIS ===
-    llm = ChatAnthropic(
-        model="claude-3-haiku-20240307",
-        temperature=0,
-        max_tokens=4096
-    )
+    # 4. Semantic pre-pass (optional): cheap local similarity evidence,
+    # and a floor below which the LLM call is skipped altogether
+    max_similarity = _semantic_prepass(aggregated, firm_data, matches, gaps)
+
+    # === LLM ANALYSIS PROMPT ===
+    from langchain_core.messages import HumanMessage, SystemMessage
 
-    req_summary = aggregated.get("all_requirements", [])[:30]
+    req_summary = _dedupe_requirements(aggregated.get("all_requirements", []))
 
     # Include scope summary from partner data for richer context
     scope_context = aggregated.get("scope_summary", "") or ""
@@ -228,20 +498,20 @@ RFP INFORMATION:
 - Agency: {aggregated.get('agency', 'Unknown')}
 - Title: {aggregated.get('title', 'Unknown')}
 - Scope Summary: {scope_context}
-- Key Tasks: {json.dumps(aggregated.get('key_tasks', []), indent=2)}
-- Certifications Required: {json.dumps(aggregated.get('certifications_required', []))}
-- Evaluation Criteria: {json.dumps(aggregated.get('evaluation_criteria', []))}
-- Sample Requirements: {json.dumps(req_summary, indent=2)}
+- Key Tasks: {json.dumps(aggregated.get('key_tasks', [])[:15], separators=_COMPACT)}
+- Certifications Required: {json.dumps(aggregated.get('certifications_required', []), separators=_COMPACT)}
+- Evaluation Criteria: {json.dumps(aggregated.get('evaluation_criteria', []), separators=_COMPACT)}
+- Sample Requirements: {json.dumps(req_summary, separators=_COMPACT)}
 
 OUR FIRM'S CAPABILITIES:
-- Core Competencies: {json.dumps(firm_data.get('capabilities', {}).get('core_competencies', []))}
-- Specialized Expertise: {json.dumps(firm_data.get('capabilities', {}).get('specialized_expertise', []))}
-- Past Performance: {json.dumps([pp.get('relevance_points', []) for pp in firm_data.get('past_performance', [])])}
-- Key Personnel Expertise: {json.dumps([p.get('expertise', '') for p in firm_data.get('key_personnel', [])])}
+- Core Competencies: {json.dumps(firm_data.get('capabilities', {}).get('core_competencies', []), separators=_COMPACT)}
+- Specialized Expertise: {json.dumps(firm_data.get('capabilities', {}).get('specialized_expertise', []), separators=_COMPACT)}
+- Past Performance: {json.dumps([pp.get('relevance_points', [])[:5] for pp in firm_data.get('past_performance', [])], separators=_COMPACT)}
+- Key Personnel Expertise: {json.dumps([p.get('expertise', '') for p in firm_data.get('key_personnel', [])], separators=_COMPACT)}
 
 ALREADY IDENTIFIED:
-- Knockouts: {json.dumps(knockouts)}
-- Matches: {json.dumps(matches)}
+- Knockouts: {json.dumps(knockouts, separators=_COMPACT)}
+- Matches: {json.dumps(matches, separators=_COMPACT)}
 
 Analyze and return JSON:
 {{
@@ -263,17 +533,103 @@ Be specific. Reference actual capabilities and requirements."""
         HumanMessage(content=analysis_prompt)
     ]
 
-    response = llm.invoke(messages)
+    return {
+        "aggregated": aggregated,
+        "knockouts": knockouts,
+        "matches": matches,
+        "gaps": gaps,
+        "naics_match": naics_match,
+        "set_aside_eligible": set_aside_eligible,
+        "max_similarity": max_similarity,
+        "messages": messages,
+    }
+
+
+def _knockout_analysis(knockouts: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Templated analysis for RFPs already disqualified programmatically.
+
+    A knockout forces the recommendation to NO-GO regardless of what the
+    LLM would say, so there is no reason to spend its latency or cost.
+    """
+    return {
+        "additional_matches": [],
+        "gaps": [],
+        "technical_summary": (
+            f"Automatic NO-GO: {knockouts[0]['type']} disqualifies this "
+            "opportunity before technical review."
+        ),
+        "recommended_personnel": [],
+        "score_adjustment": 0,
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _llm_output_schema():
+    """Build the pydantic schema for the scorer's structured output.
+
+    Defined lazily so importing this module does not pay for pydantic
+    class construction; cached because with_structured_output keys its
+    tool definition off the class object.
+    """
+    from pydantic import BaseModel, Field
+
+    class TriageLLMOutput(BaseModel):
+        """Fit analysis returned by the LLM for one solicitation."""
+        additional_matches: List[Dict[str, str]] = Field(default_factory=list)
+        gaps: List[Dict[str, str]] = Field(default_factory=list)
+        technical_summary: str = ""
+        recommended_personnel: List[str] = Field(default_factory=list)
+        score_adjustment: int = 0
 
+    return TriageLLMOutput
+
+
+def _scoring_llm(llm):
+    """Bind the structured-output schema to an LLM client.
+
+    function_calling mode returns validated TriageLLMOutput instances
+    directly, skipping the parse-JSON-out-of-prose step entirely on the
+    happy path.
+    """
+    return llm.with_structured_output(_llm_output_schema(), method="function_calling")
+
+
+def _analysis_from_response(response) -> Dict[str, Any]:
+    """Normalize an LLM response to the analysis dict.
+
+    Structured-output responses are pydantic models; the prose parser is
+    kept as a fallback for raw message responses (e.g. when a provider
+    rejects tool use and the caller retried with a plain invoke).
+    """
+    if hasattr(response, "model_dump"):
+        return response.model_dump()
+    return _parse_analysis(response.content)
+
+
+def _parse_analysis(content: str) -> Dict[str, Any]:
+    """Parse the LLM's JSON analysis, tolerating surrounding prose."""
     try:
-        analysis = json.loads(response.content)
-    except json.JSONDecodeError:
-        import re
-        json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
+        return serialization.loads(content)
+    except ValueError:
+        json_match = _JSON_BLOCK_RE.search(content)
         if json_match:
-            analysis = json.loads(json_match.group())
-        else:
-            analysis = {"additional_matches": [], "gaps": [], "technical_summary": "Analysis failed", "recommended_personnel": [], "score_adjustment": 0}
+            try:
+                return serialization.loads(json_match.group())
+            except ValueError:
+                pass
+        return dict(_FALLBACK_ANALYSIS)
+
+
+def finalize_scorer(context: Dict[str, Any], analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge the LLM analysis into a prepared context and build the report.
+    """
+    aggregated = context["aggregated"]
+    knockouts = context["knockouts"]
+    matches = context["matches"]
+    gaps = context["gaps"]
+    naics_match = context["naics_match"]
+    set_aside_eligible = context["set_aside_eligible"]
 
     # Merge LLM findings
     matches.extend(analysis.get("additional_matches", []))
@@ -321,32 +677,160 @@ Be specific. Reference actual capabilities and requirements."""
         posted_date=aggregated.get("posted_date"),
     )
 
-    state["final_report"] = report.model_dump()
-    state["knockouts"] = knockouts
-    state["matches"] = matches
-    state["gaps"] = gaps
+    return msgspec.to_builtins(report)
+
+
+def node_scorer(state: TriageState) -> Dict[str, Any]:
+    """
+    Node 2: Score one aggregated RFP against firm capabilities.
+
+    Returns only a one-element final_reports update: the Send fan-out
+    runs many scorer branches in parallel, and contributing through the
+    operator.add reducer is what keeps their writes from colliding.
+    """
+    print("\n[2/2] SCORER - Evaluating firm fit...")
+
+    firm_data = load_firm_data(state["firm_data_path"])
+
+    context = prepare_scorer(state["aggregated_rfp"], firm_data)
+
+    if context["knockouts"]:
+        # Knockouts force NO-GO; don't pay for an LLM opinion
+        analysis = _knockout_analysis(context["knockouts"])
+    elif _below_similarity_floor(context):
+        analysis = _low_similarity_analysis(context["max_similarity"])
+    else:
+        llm = _make_llm()
+        try:
+            response = _scoring_llm(llm).invoke(context["messages"])
+        except Exception:
+            # Structured output unavailable (e.g. tool use rejected);
+            # fall back to a plain call and parse JSON out of the prose
+            response = llm.invoke(context["messages"])
+        analysis = _analysis_from_response(response)
+
+    report = finalize_scorer(context, analysis)
+
+    print(f"  Match Score: {report['match_score']}/100")
+    print(f"  Recommendation: {report['recommendation']}")
+    print(f"  Knockouts: {len(context['knockouts'])}")
+    print(f"  Strong Matches: {len(context['matches'])}")
+
+    return {"final_reports": [report]}
+
+
+def _llm_cache_key(aggregated: Dict[str, Any], firm_data_hash: str) -> str:
+    """Cache key for one RFP's LLM analysis.
+
+    Keyed on solicitation identity, its last-change marker (the partner
+    feed exposes posted_date rather than a per-revision updated_at) and
+    the firm-data content hash, so either side changing invalidates the
+    entry.
+    """
+    basis = "|".join((
+        str(aggregated.get("rfp_id", "")),
+        str(aggregated.get("updated_at") or aggregated.get("posted_date") or ""),
+        firm_data_hash,
+    ))
+    return hashlib.blake2b(basis.encode(), digest_size=16).hexdigest()
+
+
+def _read_llm_cache(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Return a cached analysis dict, or None on miss/corruption."""
+    try:
+        return serialization.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_llm_cache(cache_path: Path, analysis: Dict[str, Any]) -> None:
+    """Persist an analysis atomically (tmp file + rename)."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    tmp_path.write_bytes(serialization.dumps(analysis))
+    os.replace(tmp_path, cache_path)
+
+
+def _max_concurrency() -> int:
+    """Concurrency bound for LLM calls and per-RFP finalize workers."""
+    return int(os.getenv("QUORUM_CONCURRENCY", "8"))
 
-    print(f"  Match Score: {final_score}/100")
-    print(f"  Recommendation: {recommendation}")
-    print(f"  Knockouts: {len(knockouts)}")
-    print(f"  Strong Matches: {len(matches)}")
 
-    return state
+async def _score_batch_async(
+    llm, message_batches: List[Any], max_concurrency: int = None, fallback_llm=None
+) -> List[Any]:
+    """
+    Fan the per-RFP analysis calls out concurrently.
+
+    Returns one response (or the raised exception) per batch entry, in
+    order; a semaphore bounds in-flight requests to stay inside API
+    rate limits. When fallback_llm is given, an entry whose primary call
+    fails is retried against it before the exception is surfaced — the
+    same structured-output-rejected fallback node_scorer applies to
+    single calls.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or _max_concurrency())
+
+    async def _invoke_one(messages):
+        async with semaphore:
+            try:
+                return await llm.ainvoke(messages)
+            except Exception as e:
+                if fallback_llm is None:
+                    return e
+                try:
+                    return await fallback_llm.ainvoke(messages)
+                except Exception as retry_e:
+                    return retry_e
+
+    return await asyncio.gather(*(_invoke_one(m) for m in message_batches))
 
 
 # ============================================================================
 # LANGGRAPH WORKFLOW
 # ============================================================================
 
-def create_triage_workflow() -> StateGraph:
-    """Create the LangGraph state machine workflow (Fetcher -> Scorer)."""
+@functools.lru_cache(maxsize=1)
+def create_triage_workflow():
+    """Create the LangGraph state machine workflow (Fetcher -> Scorer).
+
+    The fetcher fans out one Send per solicitation, so the scorer
+    branches execute in parallel and their reports are concatenated by
+    the final_reports reducer. Compiled graphs are stateless between
+    invocations, so one compile per process is enough.
+    """
+    from langgraph.graph import StateGraph, END
+    from langgraph.types import Send
+
+    def _fan_out(state: TriageState):
+        return [
+            Send("scorer", {
+                "firm_data_path": state["firm_data_path"],
+                "aggregated_rfp": rfp,
+            })
+            for rfp in state["solicitations"]
+        ]
+
     workflow = StateGraph(TriageState)
 
     workflow.add_node("fetcher", node_fetcher)
     workflow.add_node("scorer", node_scorer)
 
     workflow.set_entry_point("fetcher")
-    workflow.add_edge("fetcher", "scorer")
+    workflow.add_conditional_edges("fetcher", _fan_out, ["scorer"])
+    workflow.add_edge("scorer", END)
+
+    return workflow.compile()
+
+
+@functools.lru_cache(maxsize=1)
+def _scorer_only_workflow():
+    """Compile the scorer-only graph (input already mapped from the API)."""
+    from langgraph.graph import StateGraph, END
+
+    workflow = StateGraph(TriageState)
+    workflow.add_node("scorer", node_scorer)
+    workflow.set_entry_point("scorer")
     workflow.add_edge("scorer", END)
 
     return workflow.compile()
@@ -356,16 +840,18 @@ def create_triage_workflow() -> StateGraph:
 # MAIN PROCESSING FUNCTION
 # ============================================================================
 
+def _report_filename(rfp_id: str) -> str:
+    """Filesystem-safe report filename for a solicitation ID."""
+    safe_id = rfp_id.replace("/", "_").replace("\\", "_")
+    return f"triage_report_{safe_id}.json"
+
+
 def process_solicitation(aggregated_rfp: Dict[str, Any], firm_data_path: Path, output_dir: Path) -> Dict[str, Any]:
     """
     Score a single solicitation against firm capabilities.
     Uses only the scorer node (data already mapped from API).
     """
-    llm_workflow = StateGraph(TriageState)
-    llm_workflow.add_node("scorer", node_scorer)
-    llm_workflow.set_entry_point("scorer")
-    llm_workflow.add_edge("scorer", END)
-    compiled = llm_workflow.compile()
+    compiled = _scorer_only_workflow()
 
     initial_state: TriageState = {
         "firm_data_path": str(firm_data_path),
@@ -373,20 +859,15 @@ def process_solicitation(aggregated_rfp: Dict[str, Any], firm_data_path: Path, o
         "solicitations": [],
         "aggregated_rfp": aggregated_rfp,
         "firm_capabilities": {},
-        "knockouts": [],
-        "matches": [],
-        "gaps": [],
-        "final_report": {}
+        "final_reports": [],
     }
 
     final_state = compiled.invoke(initial_state)
 
     # Save report
-    report = final_state["final_report"]
-    safe_id = report.get("rfp_id", "unknown").replace("/", "_").replace("\\", "_")
-    output_path = output_dir / f"triage_report_{safe_id}.json"
-    with open(output_path, 'w') as f:
-        json.dump(report, f, indent=2)
+    report = final_state["final_reports"][0]
+    output_path = output_dir / _report_filename(report.get("rfp_id", "unknown"))
+    output_path.write_bytes(serialization.dumps(report))
 
     return report
 
@@ -408,33 +889,141 @@ def process_all_from_api(firm_data_path: Path, output_dir: Path, api_url: str =
         print("No solicitations found from API.")
         return []
 
-    solicitations = [map_to_aggregated_rfp(sol) for sol in raw_solicitations]
-    print(f"Retrieved {len(solicitations)} solicitation(s)\n")
-
-    reports = []
-
+    # Map lazily: each mapped dict is consumed once by the prepare loop,
+    # so there is no need to materialize a second full-size list
+    solicitations = (map_to_aggregated_rfp(sol) for sol in raw_solicitations)
+    total = len(raw_solicitations)
+    print(f"Retrieved {total} solicitation(s)\n")
+
+    firm_data = load_firm_data(firm_data_path)
+
+    def _error_report(aggregated: Dict[str, Any], e: Exception) -> Dict[str, Any]:
+        print(f"ERROR scoring {aggregated.get('rfp_id')}: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return {
+            "rfp_id": aggregated.get("rfp_id", "Unknown"),
+            "match_score": 0,
+            "recommendation": "ERROR",
+            "error": str(e)
+        }
+
+    cache_dir = output_dir / ".llm_cache"
+    firm_data_hash = firm_data.get("_firm_data_hash", "")
+
+    # Phase 1: programmatic checks + prompt construction (local, cheap)
+    prepared = []  # (aggregated, context or None, error report or None)
     for idx, aggregated in enumerate(solicitations, 1):
-        print(f"\n{'='*70}")
-        print(f"[{idx}/{len(solicitations)}] Scoring: {aggregated.get('title', 'Unknown')}")
+        print(f"[{idx}/{total}] Preparing: {aggregated.get('title', 'Unknown')}")
         print(f"  Agency: {aggregated.get('agency', 'Unknown')}")
         print(f"  NAICS: {', '.join(aggregated.get('naics_codes', []))}")
-        print(f"{'='*70}")
-
         try:
-            report = process_solicitation(aggregated, firm_data_path, output_dir)
-            reports.append(report)
+            context = prepare_scorer(aggregated, firm_data)
+            if not context["knockouts"] and not _below_similarity_floor(context):
+                # Reuse a previously computed analysis when neither the
+                # solicitation nor the firm data has changed
+                cache_path = cache_dir / f"{_llm_cache_key(aggregated, firm_data_hash)}.json"
+                context["cache_path"] = cache_path
+                context["cached_analysis"] = _read_llm_cache(cache_path)
+                if context["cached_analysis"] is not None:
+                    print("  LLM cache hit")
+            prepared.append((aggregated, context, None))
         except Exception as e:
-            print(f"ERROR scoring {aggregated.get('rfp_id')}: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            reports.append({
-                "rfp_id": aggregated.get("rfp_id", "Unknown"),
-                "match_score": 0,
-                "recommendation": "ERROR",
-                "error": str(e)
-            })
+            prepared.append((aggregated, None, _error_report(aggregated, e)))
+
+    # Phase 2: one batched LLM pass across all prepared RFPs. The hot
+    # path is network-bound (~2s per Haiku round trip), so overlapping
+    # the calls cuts wall time near-linearly with the batch size.
+    # Knocked-out RFPs are auto-NO-GO and skip the LLM entirely
+    pending = [
+        context for _a, context, _e in prepared
+        if context is not None and not context["knockouts"]
+        and not _below_similarity_floor(context)
+        and context.get("cached_analysis") is None
+    ]
+    responses = []
+    if pending:
+        print(f"\nScoring {len(pending)} solicitation(s) in one batched LLM pass...")
+        # The raw client is the fallback: if a provider rejects the
+        # structured-output tool call, the retry's prose response is
+        # parsed by _analysis_from_response instead of erroring the RFP
+        llm = _make_llm()
+        responses = asyncio.run(
+            _score_batch_async(
+                _scoring_llm(llm),
+                [context["messages"] for context in pending],
+                fallback_llm=llm,
+            )
+        )
+
+    # Phase 3: merge analyses, build reports, write files. The per-RFP
+    # work is parse + file write (I/O-bound), so overlap it on a bounded
+    # thread pool; results are reassembled in the original order.
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    def _finalize_one(item) -> Dict[str, Any]:
+        aggregated, context, error_report, response = item
+        if error_report is not None:
+            return error_report
+        try:
+            if context["knockouts"]:
+                analysis = _knockout_analysis(context["knockouts"])
+            elif _below_similarity_floor(context):
+                analysis = _low_similarity_analysis(context["max_similarity"])
+            elif context.get("cached_analysis") is not None:
+                analysis = context["cached_analysis"]
+            else:
+                if isinstance(response, Exception):
+                    raise response
+                analysis = _analysis_from_response(response)
+                _write_llm_cache(context["cache_path"], analysis)
+            report = finalize_scorer(context, analysis)
+            output_path = output_dir / _report_filename(report.get("rfp_id", "unknown"))
+            output_path.write_bytes(serialization.dumps(report))
+            return report
+        except Exception as e:
+            return _error_report(aggregated, e)
+
+    # Pair each prepared entry with its LLM response (if it had one)
+    response_iter = iter(responses)
+    items = []
+    for aggregated, context, error_report in prepared:
+        response = None
+        if (error_report is None and not context["knockouts"]
+                and not _below_similarity_floor(context)
+                and context.get("cached_analysis") is None):
+            response = next(response_iter)
+        items.append((aggregated, context, error_report, response))
+
+    # Emit the summary table header up front and stream each row as its
+    # report completes, so long batches give feedback as they go instead
+    # of staying silent until a final pass over the results
+    print(f"\n{'='*70}")
+    print("TRIAGE SUMMARY")
+    print(f"{'='*70}\n")
+    print(f"{'RFP':<30} {'SCORE':<10} {'RECOMMENDATION':<15} {'KNOCKOUTS':<10}")
+    print("-" * 70)
 
-    # Save summary
+    reports: List[Dict[str, Any]] = [None] * len(items)
+    with ThreadPoolExecutor(max_workers=_max_concurrency()) as executor:
+        futures = {
+            executor.submit(_finalize_one, item): idx
+            for idx, item in enumerate(items)
+        }
+        for future in as_completed(futures):
+            report = future.result()
+            reports[futures[future]] = report
+            rfp_id = report.get("rfp_id", "Unknown")
+            display_id = rfp_id[:28] if len(rfp_id) > 28 else rfp_id
+            sys.stdout.write(
+                f"{display_id:<30} {report.get('match_score', 0):<10} "
+                f"{report.get('recommendation', 'ERROR'):<15} "
+                f"{len(report.get('knockouts', [])):<10}\n"
+            )
+
+    # Save summary. The results array doubles as the dashboard's list-view
+    # index, so it carries everything needed to render a row without
+    # opening the full per-RFP report.
     summary_path = output_dir / "triage_summary.json"
     summary = {
         "processed_at": datetime.now().isoformat(),
@@ -443,33 +1032,22 @@ def process_all_from_api(firm_data_path: Path, output_dir: Path, api_url: str =
         "results": [
             {
                 "rfp_id": r.get("rfp_id"),
-                "score": r.get("match_score", 0),
+                "match_score": r.get("match_score", 0),
                 "recommendation": r.get("recommendation", "ERROR"),
                 "knockouts": len(r.get("knockouts", [])),
-                "agency": r.get("agency")
+                "agency": r.get("agency"),
+                "rfp_title": r.get("rfp_title"),
+                # Error reports are never written to disk
+                "report_file": (
+                    _report_filename(r.get("rfp_id", "unknown"))
+                    if r.get("recommendation") != "ERROR" else None
+                )
             }
             for r in reports
         ]
     }
 
-    with open(summary_path, 'w') as f:
-        json.dump(summary, f, indent=2)
-
-    # Print summary
-    print(f"\n{'='*70}")
-    print("TRIAGE SUMMARY")
-    print(f"{'='*70}\n")
-    print(f"{'RFP':<30} {'SCORE':<10} {'RECOMMENDATION':<15} {'KNOCKOUTS':<10}")
-    print("-" * 70)
-
-    for r in reports:
-        score = r.get("match_score", 0)
-        rec = r.get("recommendation", "ERROR")
-        kos = len(r.get("knockouts", []))
-        rfp_id = r.get('rfp_id', 'Unknown')
-        # Truncate long IDs for display
-        display_id = rfp_id[:28] if len(rfp_id) > 28 else rfp_id
-        print(f"{display_id:<30} {score:<10} {rec:<15} {kos:<10}")
+    summary_path.write_bytes(serialization.dumps(summary))
 
     print(f"\nReports saved to: {output_dir}")
 